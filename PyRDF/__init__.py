@@ -1,26 +1,132 @@
-from PyRDF.RDataFrame import RDataFrame  # noqa
-from PyRDF.RDataFrame import RDataFrameException  # noqa
-from PyRDF.CallableGenerator import CallableGenerator  # noqa
-from PyRDF.backend.Local import Local
-from PyRDF.backend.Backend import Backend
-from PyRDF.backend.Utils import Utils
+from itertools import chain
+import importlib
 import os
-import logging
 import sys
-from pyspark import SparkContext
-
-current_backend = Local()
+import types
+
+__all__ = [
+    "RDataFrame",
+    "RDataFrameException",
+    "CallableGenerator",
+    "Local",
+    "Backend",
+    "Utils",
+    "current_backend",
+    "includes_headers",
+    "includes_shared_libraries",
+    "includes_files",
+    "logger",
+    "create_logger",
+    "use",
+    "include_headers",
+    "include_shared_libraries",
+    "send_generic_files",
+    "initialize",
+]
+
+# Public names resolved on first access, mapped to their defining module.
+# These modules import ROOT, so loading them is deferred until needed.
+_lazy = {
+    "RDataFrame": "PyRDF.RDataFrame",
+    "RDataFrameException": "PyRDF.RDataFrame",
+    "CallableGenerator": "PyRDF.CallableGenerator",
+    "Local": "PyRDF.backend.Local",
+    "Backend": "PyRDF.backend.Backend",
+    "Utils": "PyRDF.backend.Utils",
+}
 
 includes_headers = set()  # All headers included in the analysis
 includes_shared_libraries = set()  # All shared libraries included
 includes_files = set()  # All other generic files included
 
-logger = logging.getLogger(__name__)
+_logger = None  # Package logger, created on first use
+_last_initialization = None  # Last function and arguments given to initialize
+
+# Python 2 has no sys.intern and cannot intern unicode paths, skip it there
+_intern = getattr(sys, "intern", lambda path: path)
+
+# Kind of file found in a shared library path, by extension
+_EXT_BUCKET = {"pcm": "pcm", "so": "lib", "dll": "lib", "dylib": "lib"}
+
+
+def __getattr__(name):
+    """
+    Resolves the lazily imported public names of the package (PEP 562). The
+    `current_backend` attribute is also created here on first access.
+    """
+    if name == "current_backend":
+        return _get_current_backend()
+
+    if name == "logger":
+        return _get_logger()
+
+    if name not in _lazy:
+        msg = "module '{}' has no attribute '{}'".format(__name__, name)
+        raise AttributeError(msg)
+
+    module = importlib.import_module(_lazy[name])
+    globals()[name] = getattr(module, name)
+    return globals()[name]
+
+
+class _PackageModule(types.ModuleType):
+    """
+    Type of the PyRDF package module. Importing a submodule binds it on the
+    package under its own name, so after e.g. `import PyRDF.RDataFrame` the
+    `PyRDF.RDataFrame` attribute would be the module instead of the class.
+    A module bound to a lazily imported name is replaced by its object.
+    """
+
+    def __setattr__(self, name, value):
+        """Sets the attribute, resolving submodules shadowing lazy names."""
+        if name in _lazy and isinstance(value, types.ModuleType):
+            value = getattr(value, name)
+        super(_PackageModule, self).__setattr__(name, value)
+
+
+def _get_current_backend():
+    """
+    Returns the backend in use, creating a `Local` one if the user has not
+    chosen any backend yet.
+    """
+    global current_backend
+
+    try:
+        return current_backend
+    except NameError:
+        from PyRDF.backend.Local import Local
+        current_backend = Local()
+        return current_backend
+
+
+def _is_distributed():
+    """
+    Checks whether the current backend sends the computations to remote
+    workers, i.e. whether it is not the `Local` backend.
+    """
+    from PyRDF.backend.Local import Local
+    return not isinstance(_get_current_backend(), Local)
+
+
+def _get_logger():
+    """Returns the package logger, importing `logging` only when needed."""
+    global _logger
+
+    if _logger is None:
+        import logging
+        _logger = logging.getLogger(__name__)
+
+    return _logger
 
 
-def create_logger(level="WARNING", log_path="./PyRDF.log"):
-    """PyRDF basic logger"""
-    logger = logging.getLogger(__name__)
+def create_logger(level="WARNING", log_path=None):
+    """
+    PyRDF basic logger. Messages are always printed to the standard output
+    and are also written to a file only if `log_path` is given.
+    """
+    import logging
+
+    logger = _get_logger()
 
     level = getattr(logging, level)
 
@@ -41,6 +147,38 @@ def create_logger(level="WARNING", log_path="./PyRDF.log"):
     return logger
 
 
+def _make_local(conf):
+    """Creates a `Local` backend and stops any running Spark context."""
+    from PyRDF.backend.Local import Local
+    backend = Local(conf)
+    # Stop the current Spark context if present, without creating one
+    try:
+        from pyspark import SparkContext
+    except ImportError:
+        pass
+    else:
+        cur_context = SparkContext._active_spark_context
+        if cur_context is not None:
+            cur_context.stop()
+    return backend
+
+
+def _make_spark(conf):
+    """Creates a `Spark` backend."""
+    from PyRDF.backend.Spark import Spark
+    return Spark(conf)
+
+
+# Backends that will be supported in the future
+_FUTURE_BACKENDS = frozenset({"dask"})
+
+# Factory function of each supported backend, by name
+_BACKEND_DISPATCH = {
+    "local": _make_local,
+    "spark": _make_spark,
+}
+
+
 def use(backend_name, conf={}):
     """
     Allows the user to choose the execution backend.
@@ -51,29 +189,66 @@ def use(backend_name, conf={}):
             necessary configuration parameters. Its default value is an empty
             dictionary {}.
     """
-    future_backends = [
-        "dask"
-    ]
+    global current_backend, _last_initialization
 
-    global current_backend
-
-    if backend_name in future_backends:
+    if backend_name in _FUTURE_BACKENDS:
         msg = "This backend environment will be considered in the future !"
         raise NotImplementedError(msg)
-    elif backend_name == "local":
-        current_backend = Local(conf)
-        # Retrieve current Spark context if present and stop it
-        cur_context = SparkContext.getOrCreate()
-        cur_context.stop()
-    elif backend_name == "spark":
-        from PyRDF.backend.Spark import Spark
-        current_backend = Spark(conf)
-    else:
+
+    factory = _BACKEND_DISPATCH.get(backend_name)
+    if factory is None:
         msg = "Incorrect backend environment \"{}\"".format(backend_name)
         raise Exception(msg)
 
+    current_backend = factory(conf)
+    # Let the initialization function be registered again for the new backend
+    _last_initialization = None
+
+
+def _scan(directory):
+    """
+    Recursively yields the paths to the files found in a directory. Symbolic
+    links to files are reported, symbolic links to directories are not
+    followed (same behaviour as :obj:`os.walk`).
+
+    Args:
+        directory (str): The path of the directory to be searched.
+
+    Yields:
+        str: The path to each of the files found.
+    """
+    if not hasattr(os, "scandir"):  # Python 2
+        for rootpath, _, filenames in os.walk(directory):
+            for filename in filenames:
+                yield os.path.join(rootpath, filename)
+        return
+
+    scandir = os.scandir
+    # Walk the tree with an explicit stack of directories instead of
+    # recursive generators, unreadable directories are skipped like os.walk
+    stack = [directory]
+    while stack:
+        try:
+            entries = scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    yield entry.path
+
+
+def _intern_path(path):
+    """
+    Interns a path given as a `str`. Other path-like objects (such as
+    `pathlib.Path` or `bytes`) cannot be interned and are returned unchanged.
+    """
+    return _intern(path) if isinstance(path, str) else path
+
 
-def _get_paths_set_from_string(path_string):
+def _iter_paths_from_string(path_string):
     """
     Retrieves paths to files (directory or single file) from a string.
 
@@ -81,30 +256,65 @@ def _get_paths_set_from_string(path_string):
         path_string (str): The string to the path of the file or directory
             to be recursively searched for files.
 
-    Returns:
-        set: The set with all paths returned from the directory, or a set
-            with only the path of the string.
+    Yields:
+        str: All paths found in the directory, or only the path of the string
+            if it refers to a file.
+
+    Raises:
+        IOError: If the path does not exist.
     """
-    logger.debug("Retrieving paths from {}".format(path_string))
+    _get_logger().debug("Retrieving paths from %s", path_string)
 
+    # Paths are interned: the same paths are retrieved and compared against
+    # the includes_* sets again and again during an interactive session
     if os.path.isdir(path_string):
-        # Create a set with all the headers in the directory
-        paths_set = {
-            os.path.join(rootpath, filename)
-            for rootpath, dirs, filenames
-            in os.walk(path_string)
-            for filename
-            in filenames
-        }
-        logger.debug("\nInitial path: {} \nPaths retrieved: {}".format(
-            path_string,
-            paths_set
-        ))
-        return paths_set
+        for path in _scan(path_string):
+            yield _intern_path(path)
     elif os.path.isfile(path_string):
-        # Convert to set if this is a string
-        logger.debug("File path retrieved: {}".format(path_string))
-        return {path_string}
+        yield _intern_path(path_string)
+    else:
+        raise IOError("Path \"{}\" does not exist!".format(path_string))
+
+
+def _log_paths_retrieved(initial_paths, paths_set):
+    """
+    Logs the paths retrieved from the paths given by the user. The message is
+    only built when debug logging is enabled, since the set of paths can be
+    very large.
+
+    Args:
+        initial_paths (str, iter): The path(s) given by the user.
+
+        paths_set (set): The paths retrieved from them.
+    """
+    import logging
+
+    logger = _get_logger()
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("\nInitial path: %s \nPaths retrieved: %s",
+                     initial_paths, sorted(paths_set))
+
+
+def _get_paths_set_from_strings(paths):
+    """
+    Retrieves paths to files from a string or from an iterable of strings,
+    without building intermediate sets for each of the given paths.
+
+    Args:
+        paths (str, iter): A string or an iterable of strings with the paths
+            of the files or directories to be recursively searched for files.
+
+    Returns:
+        set: The set with all paths retrieved from every given path.
+    """
+    # Keep the given paths to log them after consuming them
+    paths = [paths] if isinstance(paths, str) else list(paths)
+
+    paths_set = set(chain.from_iterable(
+        _iter_paths_from_string(path_string) for path_string in paths
+    ))
+    _log_paths_retrieved(paths, paths_set)
+    return paths_set
 
 
 def _check_pcm_in_library_path(shared_library_path):
@@ -119,24 +329,39 @@ def _check_pcm_in_library_path(shared_library_path):
         list, list: Two lists, the first with all paths to pcm files, the
             second with all paths to shared libraries.
     """
-    all_paths = _get_paths_set_from_string(
-        shared_library_path
-    )
+    pcm_paths = set()
+    libraries_path = set()
+    # Split pcm files and shared libraries in a single pass
+    for filepath in _iter_paths_from_string(shared_library_path):
+        _, dot, extension = filepath.rpartition(".")
+        bucket = _EXT_BUCKET.get(extension) if dot else None
+        if bucket == "pcm":
+            pcm_paths.add(filepath)
+        elif bucket == "lib":
+            libraries_path.add(filepath)
+
+    _log_paths_retrieved(shared_library_path, pcm_paths | libraries_path)
+    return pcm_paths, libraries_path
 
-    pcm_paths = {
-        filepath
-        for filepath in all_paths
-        if filepath.endswith(".pcm")
-    }
 
-    shared_library_formats = (".so", ".dll", ".dylib")
-    libraries_path = {
-        filepath
-        for filepath in all_paths
-        if filepath.endswith(shared_library_formats)
-    }
+def _distribute_files(paths):
+    """
+    Sends to the workers of the current backend the files that were not sent
+    to them yet. Each distributed backend keeps track of the files it
+    distributed, so files included while using another backend are still sent
+    after switching backend.
 
-    return pcm_paths, libraries_path
+    Args:
+        paths (set): Paths to the files needed on the workers.
+    """
+    if not _is_distributed():
+        return
+
+    backend = _get_current_backend()
+    new_files = paths - backend.distributed_files
+    if new_files:
+        backend.distribute_files(new_files)
+        backend.distributed_files.update(new_files)
 
 
 def include_headers(headers_paths):
@@ -150,24 +375,24 @@ def include_headers(headers_paths):
             strings. This function accepts both paths to the headers
             themselves and paths to directories containing the headers.
     """
-    global current_backend, includes_headers
-    headers_to_include = set()
+    from PyRDF.backend.Utils import Utils
 
-    if isinstance(headers_paths, str):
-        headers_to_include.update(_get_paths_set_from_string(headers_paths))
-    else:
-        for path_string in headers_paths:
-            headers_to_include.update(_get_paths_set_from_string(path_string))
+    global includes_headers
+    headers_to_include = _get_paths_set_from_strings(headers_paths)
 
     # If not on the local backend, distribute files to executors
-    if not isinstance(current_backend, Local):
-        current_backend.distribute_files(headers_to_include)
+    _distribute_files(headers_to_include)
+
+    # Headers already included are not declared again
+    new_headers = headers_to_include - includes_headers
+    if not new_headers:
+        return
 
     # Declare the headers in ROOT
-    Utils.declare_headers(headers_to_include)
+    Utils.declare_headers_batched(new_headers)
 
     # Finally, add everything to the includes set
-    includes_headers.update(headers_to_include)
+    includes_headers.update(new_headers)
 
 
 def include_shared_libraries(shared_libraries_paths):
@@ -185,7 +410,9 @@ def include_shared_libraries(shared_libraries_paths):
             libraries themselves and paths to directories containing the
             libraries.
     """
-    global current_backend, includes_shared_libraries
+    from PyRDF.backend.Utils import Utils
+
+    global includes_shared_libraries
     libraries_to_include = set()
     pcm_to_include = set()
 
@@ -201,16 +428,19 @@ def include_shared_libraries(shared_libraries_paths):
             libraries_to_include.update(libraries)
             pcm_to_include.update(pcm)
 
-    # If not on the local backend, distribute files to executors
-    if not isinstance(current_backend, Local):
-        current_backend.distribute_files(libraries_to_include)
-        current_backend.distribute_files(pcm_to_include)
+    # If not on the local backend, distribute all files to executors at once
+    _distribute_files(libraries_to_include | pcm_to_include)
+
+    # Libraries already included are not declared again
+    new_libraries = libraries_to_include - includes_shared_libraries
+    if not new_libraries:
+        return
 
     # Declare the shared libraries in ROOT
-    Utils.declare_shared_libraries(libraries_to_include)
+    Utils.declare_shared_libraries(new_libraries)
 
     # Finally, add everything to the includes set
-    includes_shared_libraries.update(includes_shared_libraries)
+    includes_shared_libraries.update(new_libraries)
 
 
 def send_generic_files(files_paths):
@@ -221,18 +451,13 @@ def send_generic_files(files_paths):
         files_paths (str, iter): Paths to the files to be sent to the
             distributed workers.
     """
-    global current_backend, includes_files
-    files_to_include = set()
-
-    if isinstance(files_paths, str):
-        files_to_include.update(_get_paths_set_from_string(files_paths))
-    else:
-        for path_string in files_paths:
-            files_to_include.update(_get_paths_set_from_string(path_string))
+    global includes_files
+    files_to_include = _get_paths_set_from_strings(files_paths)
 
     # If not on the local backend, distribute files to executors
-    if not isinstance(current_backend, Local):
-        current_backend.distribute_files(files_to_include)
+    _distribute_files(files_to_include)
+
+    includes_files.update(files_to_include)
 
 
 def initialize(fun, *args, **kwargs):
@@ -244,6 +469,12 @@ def initialize(fun, *args, **kwargs):
     This allows users to inject and execute custom code on the worker
     environment without being part of the RDataFrame computational graph.
 
+    Calling this method again with the same function object and equal
+    arguments does nothing: the function is neither registered nor executed
+    again. This is also the case when an argument is the same mutable object
+    modified in place since the previous call. Calling :func:`use` resets
+    this, so the next call registers and executes the function again.
+
     Args:
         fun (function): Function to be executed.
 
@@ -252,4 +483,35 @@ def initialize(fun, *args, **kwargs):
 
         **kwargs (dict): Keyword arguments used to execute the function.
     """
+    from PyRDF.backend.Backend import Backend
+
+    global _last_initialization
+    initialization = (fun, args, kwargs)
+
+    # Do not register and run again the same function with the same arguments
+    if _last_initialization is not None:
+        last_fun, last_args, last_kwargs = _last_initialization
+        try:
+            if fun is last_fun and args == last_args and kwargs == last_kwargs:
+                return
+        except (TypeError, ValueError):
+            # Arguments that cannot be compared are considered different
+            pass
+
     Backend.register_initialization(fun, *args, **kwargs)
+    _last_initialization = initialization
+
+
+if sys.version_info < (3, 7):
+    # Module level __getattr__ is not supported, import everything eagerly
+    from PyRDF.RDataFrame import RDataFrame  # noqa
+    from PyRDF.RDataFrame import RDataFrameException  # noqa
+    from PyRDF.CallableGenerator import CallableGenerator  # noqa
+    from PyRDF.backend.Local import Local  # noqa
+    from PyRDF.backend.Backend import Backend  # noqa
+    from PyRDF.backend.Utils import Utils  # noqa
+
+    current_backend = Local()
+    logger = _get_logger()
+else:
+    sys.modules[__name__].__class__ = _PackageModule
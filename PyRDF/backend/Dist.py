@@ -101,6 +101,9 @@ class Dist(Backend):
 
         friend_info (PyRDF.Dist.FriendInfo): A class instance that holds
             information about any friend trees of the main ROOT.TTree
+
+        distributed_files (set): Paths to the files already sent to the
+            workers with :meth:`distribute_files`.
     """
 
     def __init__(self, config={}):
@@ -135,6 +138,8 @@ class Dist(Backend):
 
         self.friend_info = FriendInfo()
 
+        self.distributed_files = set()
+
     def get_clusters(self, treename, filelist):
         """
         Extract a list of cluster boundaries for the given tree and files
@@ -66,8 +66,9 @@ class Local(Backend):
         nodes = generator.get_action_nodes()
 
         # Retrieve action names and output to debug logger
-        action_names = [node.operation.name for node in nodes]
-        logger.debug("Action operations in the loop:\n{}".format(action_names))
+        if logger.isEnabledFor(logging.DEBUG):
+            action_names = [node.operation.name for node in nodes]
+            logger.debug("Action operations in the loop:\n%s", action_names)
 
         # values[0].GetValue()  # Trigger event-loop
 
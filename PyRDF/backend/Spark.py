@@ -92,7 +92,7 @@ class Spark(Dist):
                 SparkFiles.get(ntpath.basename(filepath))
                 for filepath in includes_headers
             ]
-            Utils.declare_headers(headers_on_executor)
+            Utils.declare_headers_batched(headers_on_executor)
 
             # Get and declare shared libraries on each worker
             shared_libs_on_ex = [
@@ -24,8 +24,9 @@ class Utils(object):
         ROOT.gInterpreter.AddIncludePath(root_path)
 
         # Retrieve ROOT internal list of include paths and add debug statement
-        root_includepath = ROOT.gInterpreter.GetIncludePath()
-        logger.debug("ROOT include paths:\n{}".format(root_includepath))
+        if logger.isEnabledFor(logging.DEBUG):
+            root_includepath = ROOT.gInterpreter.GetIncludePath()
+            logger.debug("ROOT include paths:\n%s", root_includepath)
 
     @classmethod
     def declare_headers(cls, headers_to_include):
@@ -49,6 +50,52 @@ class Utils(object):
                 msg = "There was an error in including \"{}\" !".format(header)
                 raise e(msg)
 
+    @classmethod
+    def declare_headers_batched(cls, headers_to_include, fallback=True):
+        """
+        Declares all required headers with a single call to ROOT's C++
+        Interpreter, so the fixed cost of each declaration is only paid once.
+
+        Args:
+            headers_to_include (list): This list should consist of all
+                necessary C++ headers as strings.
+
+            fallback (bool, optional): If the declaration of the whole batch
+                fails, declare the headers one at a time instead, which
+                succeeds if every header can be declared on its own and
+                otherwise reports the header that fails. Default value is
+                True.
+
+        Raises:
+            Exception: If the headers cannot be declared. With `fallback`,
+                the message names the first header that fails.
+        """
+        headers_to_include = list(headers_to_include)
+        if not headers_to_include:
+            return
+
+        # Add every header directory to ROOT's include path only once
+        for header_dir in {os.path.dirname(h) for h in headers_to_include}:
+            cls.extend_include_path(header_dir)
+
+        # Create C++ include code for all headers
+        include_code = "".join(
+            "#include \"{}\"\n".format(header)
+            for header in headers_to_include
+        )
+        if ROOT.gInterpreter.Declare(include_code):
+            return
+
+        if not fallback:
+            raise Exception("There was an error in including the headers !")
+
+        for header in headers_to_include:
+            include_code = "#include \"{}\"\n".format(header)
+            if not ROOT.gInterpreter.Declare(include_code):
+                msg = "There was an error in including \"{}\" !".format(
+                    header)
+                raise Exception(msg)
+
     @classmethod
     def declare_shared_libraries(cls, libraries_to_include):
         """
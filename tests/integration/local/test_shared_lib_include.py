@@ -44,6 +44,9 @@ class SharedLibrariesIncludeLocalTest(unittest.TestCase):
 
         PyRDF.include_shared_libraries(so_path)
 
+        # The library is recorded to be loaded on the workers
+        self.assertIn(so_path, PyRDF.includes_shared_libraries)
+
         # The user can include directly the header related to the library
         # or choose to declare functions or objects later
         header_path = (
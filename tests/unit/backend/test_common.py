@@ -1,7 +1,16 @@
+import importlib
+import sys
 import unittest
 import ROOT
+try:
+    import pathlib
+except ImportError:  # Python 2
+    pathlib = None
 import PyRDF
+from PyRDF.backend.Dist import Dist
+from PyRDF.backend.Local import Local
 from PyRDF.backend.Utils import Utils
+import PyRDF.backend.Utils as utils_module
 
 
 class SelectionTest(unittest.TestCase):
@@ -32,6 +41,51 @@ class SelectionTest(unittest.TestCase):
         # Check that `use` function correctly stopped the Spark context
         self.assertTrue(javacon.isStopped())
 
+    def test_local_does_not_start_spark(self):
+        """
+        Test that switching to local does not create a SparkContext when none
+        is running
+        """
+        from pyspark import SparkContext
+
+        # Make sure no Spark context is running
+        if SparkContext._active_spark_context is not None:
+            SparkContext._active_spark_context.stop()
+
+        PyRDF.use("local")
+
+        self.assertIsNone(SparkContext._active_spark_context)
+
+
+class LazyAttributesTest(unittest.TestCase):
+    """Check the lazily resolved attributes of the PyRDF package."""
+
+    @unittest.skipIf(sys.version_info < (3, 7), "Names imported eagerly")
+    def test_lazy_names_are_not_submodules(self):
+        """
+        Lazily imported names resolve to the classes even though they share
+        the name of the submodule where they are defined, and the submodule
+        was imported before the name was accessed.
+
+        """
+        rdataframe_module = importlib.import_module("PyRDF.RDataFrame")
+        generator_module = importlib.import_module("PyRDF.CallableGenerator")
+
+        # The first import of a submodule binds it on the package, redo it
+        # so the test does not depend on which modules were already imported
+        PyRDF.RDataFrame = rdataframe_module
+        PyRDF.CallableGenerator = generator_module
+
+        self.assertIs(PyRDF.RDataFrame, rdataframe_module.RDataFrame)
+
+        from PyRDF import CallableGenerator
+        self.assertIs(CallableGenerator, generator_module.CallableGenerator)
+
+    def test_unknown_attribute(self):
+        """Unknown attributes of the package raise an AttributeError."""
+        with self.assertRaises(AttributeError):
+            PyRDF.not_an_attribute
+
 
 class BackendInitTest(unittest.TestCase):
     """Backend abstract class cannot be instantiated."""
@@ -74,6 +128,23 @@ class IncludeHeadersTest(unittest.TestCase):
         with self.assertRaises(TypeError):
             PyRDF.include_headers()
 
+    def test_missing_path_include(self):
+        """
+        'PyRDF.include' function raises an IOError if a path does not
+        exist.
+
+        """
+        with self.assertRaises(IOError):
+            PyRDF.include_headers(["tests/unit/backend/test_headers/nothere"])
+
+    @unittest.skipIf(pathlib is None, "pathlib is not available")
+    def test_path_object_include(self):
+        """'PyRDF.include' with a list of `pathlib.Path` objects."""
+        header = pathlib.Path("tests/unit/backend/test_headers/header1.hxx")
+        PyRDF.include_headers([header])
+
+        self.assertEqual(PyRDF.includes_headers, {header})
+
     def test_string_include(self):
         """'PyRDF.include' with a single string."""
         PyRDF.include_headers("tests/unit/backend/test_headers/header1.hxx")
@@ -115,6 +186,82 @@ class IncludeHeadersTest(unittest.TestCase):
             self.assertItemsEqual(PyRDF.includes_headers, required_list)
 
 
+class IncludeOnceTest(unittest.TestCase):
+    """Files already included are not distributed again."""
+
+    class TestBackend(Dist):
+        """Dummy backend recording the files sent to the workers."""
+
+        def ProcessAndMerge(self, mapper, reducer):
+            """Dummy implementation of ProcessAndMerge. Does nothing."""
+            pass
+
+        def distribute_files(self, includes_list):
+            """Record the files of each call to distribute_files."""
+            self.distributed.append(set(includes_list))
+
+    def setUp(self):
+        """Set a dummy distributed backend"""
+        self.previous_backend = PyRDF.current_backend
+        self.backend = IncludeOnceTest.TestBackend()
+        self.backend.distributed = []
+        PyRDF.current_backend = self.backend
+
+    def tearDown(self):
+        """Restore the backend and remove included files"""
+        PyRDF.current_backend = self.previous_backend
+        PyRDF.includes_headers.clear()
+        PyRDF.includes_files.clear()
+
+    def test_header_included_twice(self):
+        """A header included twice is only distributed once."""
+        header = "tests/unit/backend/test_headers/header1.hxx"
+        PyRDF.include_headers(header)
+        PyRDF.include_headers([header])
+
+        self.assertListEqual(self.backend.distributed, [{header}])
+
+    def test_header_included_before_switching_backend(self):
+        """
+        A header included while using the local backend is distributed when
+        it is included again after switching to a distributed backend.
+
+        """
+        header = "tests/unit/backend/test_headers/header1.hxx"
+        PyRDF.current_backend = Local()
+        PyRDF.include_headers(header)
+
+        PyRDF.current_backend = self.backend
+        PyRDF.include_headers(header)
+
+        self.assertListEqual(self.backend.distributed, [{header}])
+
+    def test_header_included_with_new_backend(self):
+        """
+        A header already distributed by a backend is distributed again by a
+        new distributed backend.
+
+        """
+        header = "tests/unit/backend/test_headers/header1.hxx"
+        PyRDF.include_headers(header)
+
+        new_backend = IncludeOnceTest.TestBackend()
+        new_backend.distributed = []
+        PyRDF.current_backend = new_backend
+        PyRDF.include_headers(header)
+
+        self.assertListEqual(self.backend.distributed, [{header}])
+        self.assertListEqual(new_backend.distributed, [{header}])
+
+    def test_generic_file_sent_twice(self):
+        """A generic file sent twice is only distributed once."""
+        header = "tests/unit/backend/test_headers/header1.hxx"
+        PyRDF.send_generic_files(header)
+        PyRDF.send_generic_files(header)
+
+        self.assertListEqual(self.backend.distributed, [{header}])
+
+
 class DeclareHeadersTest(unittest.TestCase):
     """Static method 'declare_headers' in Backend class."""
 
@@ -137,6 +284,44 @@ class DeclareHeadersTest(unittest.TestCase):
         self.assertEqual(ROOT.f1(2), 2)
         self.assertEqual(ROOT.f2("myString"), "myString")
 
+    def test_multiple_headers_declare_batched(self):
+        """'declare_headers_batched' with multiple headers to be included."""
+        Utils.declare_headers_batched([
+            "tests/unit/backend/test_headers/header2.hxx",
+            "tests/unit/backend/test_headers/header3.hxx"
+        ])
+
+        self.assertEqual(ROOT.a(1), True)
+        self.assertEqual(ROOT.f1(2), 2)
+        self.assertEqual(ROOT.f2("myString"), "myString")
+
+    def test_headers_declare_batched_error(self):
+        """
+        'declare_headers_batched' without fallback raises an Exception if the
+        headers cannot be declared.
+
+        """
+        with self.assertRaises(Exception):
+            Utils.declare_headers_batched(
+                ["tests/unit/backend/test_headers/nothere.hxx"],
+                fallback=False
+            )
+
+    def test_headers_declare_batched_fallback_error(self):
+        """
+        'declare_headers_batched' with fallback raises an Exception naming
+        the header that cannot be declared.
+
+        """
+        missing_header = "tests/unit/backend/test_headers/nothere.hxx"
+        with self.assertRaises(Exception) as context:
+            Utils.declare_headers_batched([
+                "tests/unit/backend/test_headers/header1.hxx",
+                missing_header
+            ])
+
+        self.assertIn(missing_header, str(context.exception))
+
     def test_header_declaration_on_current_session(self):
         """Header has to be declared on the current session"""
         # Before the header declaration the function f is not present on the
@@ -147,6 +332,52 @@ class DeclareHeadersTest(unittest.TestCase):
         self.assertEqual(ROOT.b(1), True)
 
 
+class DeclareHeadersFallbackTest(unittest.TestCase):
+    """Fallback of 'declare_headers_batched' to one header at a time."""
+
+    class TestInterpreter(object):
+        """Dummy interpreter failing to declare more than one header."""
+
+        def __init__(self):
+            """Creates an interpreter without declared code."""
+            self.declared = []
+
+        def AddIncludePath(self, include_path):
+            """Dummy implementation of AddIncludePath. Does nothing."""
+            pass
+
+        def Declare(self, code):
+            """Only declares code including a single header."""
+            if code.count("#include") > 1:
+                return False
+            self.declared.append(code)
+            return True
+
+    def setUp(self):
+        """Replace ROOT's interpreter used by the `Utils` class"""
+        self.utils_root = utils_module.ROOT
+        self.interpreter = DeclareHeadersFallbackTest.TestInterpreter()
+        utils_module.ROOT = type("TestROOT", (object,), {
+            "gInterpreter": self.interpreter
+        })
+
+    def tearDown(self):
+        """Restore ROOT in the `Utils` module"""
+        utils_module.ROOT = self.utils_root
+
+    def test_batch_fails_headers_succeed(self):
+        """
+        The headers are declared without errors when the batch fails but
+        each header can be declared on its own.
+
+        """
+        headers = ["tests/unit/backend/test_headers/header1.hxx",
+                   "tests/unit/backend/test_headers/header2.hxx"]
+        Utils.declare_headers_batched(headers)
+
+        self.assertEqual(len(self.interpreter.declared), 2)
+
+
 class InitializationTest(unittest.TestCase):
     """Check the initialize method"""
 
@@ -163,6 +394,24 @@ class InitializationTest(unittest.TestCase):
         f = PyRDF.current_backend.initialization
         self.assertEqual(f(), 123)
 
+    def test_initialization_same_function_and_arguments(self):
+        """
+        Initializing again with the same function and arguments does not run
+        the function again, while different arguments do.
+
+        """
+        calls = []
+
+        def appendValue(value):
+            calls.append(value)
+
+        PyRDF.initialize(appendValue, 1)
+        PyRDF.initialize(appendValue, 1)
+        self.assertListEqual(calls, [1])
+
+        PyRDF.initialize(appendValue, 2)
+        self.assertListEqual(calls, [1, 2])
+
     def test_initialization_runs_in_current_environment(self):
         """
         User initialization method should be executed on the current user
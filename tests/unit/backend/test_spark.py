@@ -1,5 +1,6 @@
 import unittest
 import PyRDF
+from PyRDF.backend.Dist import Dist
 from PyRDF.backend.Spark import Spark
 from PyRDF.backend.Local import Local
 from pyspark import SparkContext
@@ -28,13 +29,18 @@ class SparkBackendInitTest(unittest.TestCase):
     """
     Tests to ensure that the instance variables
     of `Spark` class are set according to the
-    input `config` dict.
+    input `config` dict. All tests share the same default `SparkContext`.
 
     """
 
     @classmethod
-    def tearDown(cls):
-        """Clean up the `SparkContext` objects that were created."""
+    def setUpClass(cls):
+        """Create the `SparkContext` shared by the tests in this class."""
+        SparkContext.getOrCreate()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up the `SparkContext` shared by the tests in this class."""
         context = SparkContext.getOrCreate()
         context.stop()
 
@@ -49,6 +55,37 @@ class SparkBackendInitTest(unittest.TestCase):
         self.assertDictEqual(backend.config, {})
         self.assertIsInstance(backend.sparkContext, SparkContext)
 
+    def test_set_npartitions_explicit(self):
+        """
+        Check that the number of partitions is correctly set for a given input
+        value in the config dictionary.
+
+        """
+        backend = Spark({"npartitions": 5})
+        self.assertEqual(backend.npartitions, 5)
+
+    def test_npartitions_default(self):
+        """
+        Check that the default number of partitions is correctly set when no
+        input value is given in the config dictionary.
+
+        """
+        backend = Spark()
+        self.assertEqual(backend.npartitions, Spark.MIN_NPARTITIONS)
+
+
+class SparkBackendConfTest(unittest.TestCase):
+    """
+    Tests that depend on the configuration used to create the `SparkContext`,
+    hence each of them needs a new context.
+
+    """
+
+    def tearDown(self):
+        """Clean up the `SparkContext` objects that were created."""
+        context = SparkContext.getOrCreate()
+        context.stop()
+
     def test_set_spark_context_with_conf(self):
         """
         Check that a `SparkContext` object is correctly created for a given
@@ -61,15 +98,6 @@ class SparkBackendInitTest(unittest.TestCase):
         appname = backend.sparkContext.getConf().get('spark.app.name')
         self.assertEqual(appname, 'my-pyspark-app1')
 
-    def test_set_npartitions_explicit(self):
-        """
-        Check that the number of partitions is correctly set for a given input
-        value in the config dictionary.
-
-        """
-        backend = Spark({"npartitions": 5})
-        self.assertEqual(backend.npartitions, 5)
-
     def test_npartitions_with_num_executors(self):
         """
         Check that the number of partitions is correctly set to number of
@@ -91,15 +119,6 @@ class SparkBackendInitTest(unittest.TestCase):
         backend = Spark()
         self.assertEqual(backend.npartitions, 15)
 
-    def test_npartitions_default(self):
-        """
-        Check that the default number of partitions is correctly set when no
-        input value is given in the config dictionary.
-
-        """
-        backend = Spark()
-        self.assertEqual(backend.npartitions, Spark.MIN_NPARTITIONS)
-
 
 class OperationSupportTest(unittest.TestCase):
     """
@@ -108,25 +127,30 @@ class OperationSupportTest(unittest.TestCase):
 
     """
 
-    @classmethod
-    def tearDown(cls):
-        """Clean up the `SparkContext` objects that were created."""
-        context = SparkContext.getOrCreate()
-        context.stop()
+    class TestSpark(Spark):
+        """
+        Spark backend that does not create a `SparkContext`, which is not
+        needed to check the supported operations.
+
+        """
+
+        def __init__(self):
+            """Only set up the attributes of the `Dist` backend."""
+            Dist.__init__(self, {})
 
     def test_action(self):
         """Check that action nodes are classified accurately."""
-        backend = Spark()
+        backend = OperationSupportTest.TestSpark()
         backend.check_supported("Histo1D")
 
     def test_transformation(self):
         """Check that transformation nodes are classified accurately."""
-        backend = Spark()
+        backend = OperationSupportTest.TestSpark()
         backend.check_supported("Define")
 
     def test_unsupported_operations(self):
         """Check that unsupported operations raise an Exception."""
-        backend = Spark()
+        backend = OperationSupportTest.TestSpark()
         with self.assertRaises(Exception):
             backend.check_supported("Take")
 
@@ -138,7 +162,7 @@ class OperationSupportTest(unittest.TestCase):
 
     def test_none(self):
         """Check that incorrect operations raise an Exception."""
-        backend = Spark()
+        backend = OperationSupportTest.TestSpark()
         with self.assertRaises(Exception):
             backend.check_supported("random")
 
@@ -148,7 +172,7 @@ class OperationSupportTest(unittest.TestCase):
         Exception in multi-threaded mode.
 
         """
-        backend = Spark()
+        backend = OperationSupportTest.TestSpark()
         with self.assertRaises(Exception):
             backend.check_supported("Range")
 